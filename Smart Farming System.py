@@ -1,18 +1,37 @@
 # Smart Farming System
+#
+# Requires numpy; numba is only needed for CropHealthAnalyzer.analyze_health_batch
+# (see requirements.txt).
 
 import random
+import re
+import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
 import os
 
+import numpy as np
+
+
+def format_timestamp(timestamp):
+    # Timestamps are stored as time.time_ns() ints and only formatted for display
+    if isinstance(timestamp, (int, np.integer)) and not isinstance(timestamp, bool):
+        return datetime.fromtimestamp(timestamp / 1e9).isoformat(timespec='seconds')
+    return timestamp
+
 # Base Device Class
 
 
 class Device:
+    __slots__ = ('device_id', 'device_type', 'status', 'location', '_kind')
+
     def __init__(self, device_id, device_type, location):
         self.device_id = device_id
         self.device_type = device_type
         self.status = "OFF"
         self.location = location
+        self._kind = None
 
     def toggle_status(self):
         self.status = "ON" if self.status == "OFF" else "OFF"
@@ -25,38 +44,84 @@ class Device:
 
 
 class Sensor(Device):
+    __slots__ = ('_ts', '_val', '_n')
+
     def __init__(self, device_id, device_type, location):
         super().__init__(device_id, device_type, location)
-        self.readings = {}
+        # Readings are kept column-wise: time_ns timestamps and their values.
+        # Buffers are allocated on the first reading.
+        self._ts = None
+        self._val = None
+        self._n = 0
 
     def record_reading(self, timestamp, value):
-        self.readings[timestamp] = value
+        if isinstance(timestamp, str):
+            try:
+                parsed = datetime.fromisoformat(timestamp)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid reading timestamp {timestamp!r}: expected a time_ns int "
+                    "or an ISO 8601 string") from None
+            timestamp = (int(parsed.replace(microsecond=0).timestamp()) * 10**9
+                         + parsed.microsecond * 1000)
+        if self._ts is None:
+            self._ts = np.empty(16, dtype=np.int64)
+            self._val = np.empty(16, dtype=np.float64)
+        elif self._n == len(self._ts):
+            self._ts = np.resize(self._ts, 2 * self._n)
+            self._val = np.resize(self._val, 2 * self._n)
+        self._ts[self._n] = timestamp
+        self._val[self._n] = value
+        self._n += 1
 
     def get_readings(self):
-        return self.readings
+        if self._ts is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        ts = self._ts[:self._n]
+        val = self._val[:self._n]
+        ts.setflags(write=False)
+        val.setflags(write=False)
+        return ts, val
 
 # SoilMoistureSensor
 
 
 class SoilMoistureSensor(Sensor):
+    __slots__ = ('threshold', 'alerts')
+
     def __init__(self, device_id, location, threshold):
         super().__init__(device_id, "SoilMoistureSensor", location)
+        self._kind = 'soil'
         self.threshold = threshold
         self.alerts = []
 
     def check_moisture(self, current_level):
         return current_level < self.threshold
 
-    def trigger_alert(self, timestamp):
+    def check_moisture_batch(self, levels):
+        return np.less(levels, self.threshold)
+
+    def trigger_alert(self, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time_ns()
         self.alerts.append(timestamp)
-        print(f"🌟 Moisture alert at {timestamp}! Moisture too low!")
+        print(f"🌟 Moisture alert at {format_timestamp(timestamp)}! Moisture too low!")
+
+    def trigger_alerts_batch(self, timestamps, mask):
+        triggered = np.asarray(timestamps)[mask].tolist()
+        if triggered:
+            self.alerts.extend(triggered)
+            print(f"🌟 {len(triggered)} moisture alerts! Moisture too low!")
 
 # WeatherMonitor
 
 
 class WeatherMonitor(Sensor):
+    __slots__ = ('temperature', 'humidity', 'alerts')
+
     def __init__(self, device_id, location):
         super().__init__(device_id, "WeatherMonitor", location)
+        self._kind = 'weather'
         self.temperature = 0
         self.humidity = 0
         self.alerts = set()
@@ -66,19 +131,26 @@ class WeatherMonitor(Sensor):
         self.humidity = humidity
 
     def generate_weather_alert(self):
-        if self.temperature > 40:
-            self.alerts.add("🌟 High Temperature Alert")
-        if self.humidity < 20:
-            self.alerts.add("🌟 Low Humidity Alert")
-        for alert in self.alerts:
+        # self.alerts only de-duplicates; each alert is printed once when first raised
+        new = []
+        if self.temperature > 40 and "hi_temp" not in self.alerts:
+            self.alerts.add("hi_temp")
+            new.append("🌟 High Temperature Alert")
+        if self.humidity < 20 and "lo_humidity" not in self.alerts:
+            self.alerts.add("lo_humidity")
+            new.append("🌟 Low Humidity Alert")
+        for alert in new:
             print(f"{alert}")
 
 # IrrigationController
 
 
 class IrrigationController(Device):
+    __slots__ = ('water_flow_rate', 'max_water_usage', 'history')
+
     def __init__(self, device_id, location, water_flow_rate):
         super().__init__(device_id, "IrrigationController", location)
+        self._kind = 'irrig'
         self.water_flow_rate = water_flow_rate
         self.max_water_usage = 1000  # liters
         self.history = {}
@@ -91,8 +163,7 @@ class IrrigationController(Device):
         if water_used > self.max_water_usage:
             print("Cannot irrigate: exceeds max water usage limit.")
             return
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.history[timestamp] = water_used
+        self.history[time.time_ns()] = water_used
         print(f"🌟 Watering crops for {duration} mins. Used {water_used}L.")
 
     def stop_irrigation(self):
@@ -101,12 +172,37 @@ class IrrigationController(Device):
     def get_irrigation_history(self):
         return self.history
 
+    def get_irrigation_history_formatted(self):
+        return {format_timestamp(ts): water_used
+                for ts, water_used in self.history.items()}
+
 # CropHealthAnalyzer
 
 
+def _health_kernel(soil, temp, humidity):
+    return np.clip((soil + humidity - temp) * 0.5, 0.0, 100.0)
+
+
+_compiled_health_kernel = None
+
+
+def _get_health_kernel():
+    # numba is imported and the kernel compiled on first batch use only
+    global _compiled_health_kernel
+    if _compiled_health_kernel is None:
+        from numba import njit
+        # numba reloads cached kernels by importing this module, so only cache
+        # when it is registered (run as a script or imported, not via run_path)
+        _compiled_health_kernel = njit(cache=__name__ in sys.modules)(_health_kernel)
+    return _compiled_health_kernel
+
+
 class CropHealthAnalyzer(Device):
+    __slots__ = ('health_index', 'soil_quality')
+
     def __init__(self, device_id, location):
         super().__init__(device_id, "CropHealthAnalyzer", location)
+        self._kind = 'crop'
         self.health_index = 100
         self.soil_quality = 100
 
@@ -121,6 +217,15 @@ class CropHealthAnalyzer(Device):
             0, min(100, (soil_quality + humidity - temp) / 2))
         print(f"🌟 Crop Health Index: {self.health_index:.2f}")
 
+    def analyze_health_batch(self, soil_arr, temp_arr, hum_arr):
+        if self.status != "ON":
+            print("CropHealthAnalyzer must be ON to analyze health.")
+            return
+        # atleast_1d lets scalar inputs through the array kernel
+        soil, temp, hum = (np.atleast_1d(np.asarray(arr, dtype=np.float64))
+                           for arr in (soil_arr, temp_arr, hum_arr))
+        return _get_health_kernel()(soil, temp, hum)
+
     def generate_recommendations(self):
         if self.health_index < 50:
             print("🌟 Recommend: Improve soil quality or adjust irrigation.")
@@ -142,45 +247,60 @@ class Station:
 
     def log_event(self, timestamp, description):
         self.logs[timestamp] = description
-        print(f"🌟 Event Logged at {timestamp}: {description}")
+        print(f"🌟 Event Logged at {format_timestamp(timestamp)}: {description}")
 
 # Main System
 
+_DEVICE_ALIASES = MappingProxyType({
+    'soil': 'SoilMoistureSensor',
+    'weather': 'WeatherMonitor',
+    'irrigation': 'IrrigationController',
+    'crop': 'CropHealthAnalyzer',
+    'health': 'CropHealthAnalyzer'
+})
+# Exact matches (full names and short keys) resolve in one lookup
+_EXACT_DEVICE_TYPES = MappingProxyType(
+    {v.lower(): v for v in _DEVICE_ALIASES.values()} | dict(_DEVICE_ALIASES))
+_ALIAS_RE = re.compile('|'.join(re.escape(key) for key in _DEVICE_ALIASES))
+# When several aliases appear in the input, the earliest one in the table wins.
+# finditer only yields non-overlapping matches; that is safe because no alias
+# ends with the start of another, so no higher-ranked alias can be hidden.
+_ALIAS_RANK = MappingProxyType(
+    {key: rank for rank, key in enumerate(_DEVICE_ALIASES)})
+
 
 class Main:
+    _DEVICE_CTORS = {
+        "SoilMoistureSensor": lambda did, loc, kw: SoilMoistureSensor(
+            did, loc, kw.get("threshold", 30)),
+        "WeatherMonitor": lambda did, loc, kw: WeatherMonitor(did, loc),
+        "IrrigationController": lambda did, loc, kw: IrrigationController(
+            did, loc, kw.get("water_flow_rate", 10)),
+        "CropHealthAnalyzer": lambda did, loc, kw: CropHealthAnalyzer(did, loc),
+    }
+
     def __init__(self):
-        self.stations = {}
-        self.devices = {}
-        self.device_counter = 0
-        self.station_counter = 0
-        self.device_type_mapping = {
-            'soil': 'SoilMoistureSensor',
-            'weather': 'WeatherMonitor',
-            'irrigation': 'IrrigationController',
-            'crop': 'CropHealthAnalyzer',
-            'health': 'CropHealthAnalyzer'
-        }
+        # IDs are list indices; stations and devices are never removed
+        self.stations = []
+        self.devices = []
 
     def resolve_device_type(self, user_input):
         user_input = user_input.lower().strip()
-        full_names = ['SoilMoistureSensor', 'WeatherMonitor',
-                      'IrrigationController', 'CropHealthAnalyzer']
-        for name in full_names:
-            if user_input == name.lower():
-                return name
-        for key, value in self.device_type_mapping.items():
-            if key in user_input:
-                return value
-        return None
+        resolved = _EXACT_DEVICE_TYPES.get(user_input)
+        if resolved is not None:
+            return resolved
+        matched = {match.group(0) for match in _ALIAS_RE.finditer(user_input)}
+        if not matched:
+            return None
+        return _DEVICE_ALIASES[min(matched, key=_ALIAS_RANK.__getitem__)]
 
     def create_station(self, x, y):
-        station = Station(self.station_counter, x, y)
-        self.stations[self.station_counter] = station
-        print(f"🌟 Station {self.station_counter} created at ({x}, {y}).")
-        self.station_counter += 1
+        station_id = len(self.stations)
+        self.stations.append(Station(station_id, x, y))
+        print(f"🌟 Station {station_id} created at ({x}, {y}).")
 
     def create_device(self, device_type, location, **kwargs):
-        if location not in self.stations:
+        if not 0 <= location < len(self.stations):
             print("🌟 Error: Station does not exist.")
             return
 
@@ -189,35 +309,24 @@ class Main:
             print("Unknown device type. Try 'soil', 'weather', 'irrigation', or 'crop'")
             return
 
-        if resolved_type == "SoilMoistureSensor":
-            device = SoilMoistureSensor(
-                self.device_counter, location, kwargs.get("threshold", 30))
-        elif resolved_type == "WeatherMonitor":
-            device = WeatherMonitor(self.device_counter, location)
-        elif resolved_type == "IrrigationController":
-            device = IrrigationController(
-                self.device_counter, location, kwargs.get("water_flow_rate", 10))
-        elif resolved_type == "CropHealthAnalyzer":
-            device = CropHealthAnalyzer(self.device_counter, location)
-        else:
-            print("Unknown device type.")
-            return
+        device_id = len(self.devices)
+        device = self._DEVICE_CTORS[resolved_type](device_id, location, kwargs)
 
-        self.devices[self.device_counter] = device
+        self.devices.append(device)
         self.stations[location].add_device(device)
         print(
-            f"🌟 {resolved_type} with ID {self.device_counter} added to Station {location}.")
-        self.device_counter += 1
+            f"🌟 {resolved_type} with ID {device_id} added to Station {location}.")
 
     def modify_device(self, device_id):
-        if device_id not in self.devices:
+        if not 0 <= device_id < len(self.devices):
             print("Device not found.")
             return
 
         device = self.devices[device_id]
         print(f"Editing Device ID {device_id} ({device.device_type})")
 
-        if isinstance(device, SoilMoistureSensor):
+        kind = device._kind
+        if kind == 'soil':
             new_threshold = float(
                 input("Enter new moisture threshold (0–100): "))
             if 0 <= new_threshold <= 100:
@@ -225,7 +334,7 @@ class Main:
                 print(f"Threshold updated to {new_threshold}%")
             else:
                 print("Invalid threshold range.")
-        elif isinstance(device, IrrigationController):
+        elif kind == 'irrig':
             new_rate = float(input("Enter new water flow rate: "))
             if new_rate > 0:
                 device.water_flow_rate = new_rate
@@ -236,30 +345,55 @@ class Main:
             print("This device has no editable settings.")
 
     def toggle_device_status(self, device_id):
-        if device_id not in self.devices:
+        if not 0 <= device_id < len(self.devices):
             print("Device not found.")
             return
         self.devices[device_id].toggle_status()
 
     def display_state(self):
-        for sid, station in self.stations.items():
-            print(f"\n🌟 Station {sid}: Coordinates {station.coordinates}")
+        lines = []
+        for sid, station in enumerate(self.stations):
+            lines.append(f"\n🌟 Station {sid}: Coordinates {station.coordinates}")
             for dev in station.devices:
                 info = dev.device_info()
-                if isinstance(dev, SoilMoistureSensor):
+                kind = dev._kind
+                if kind == 'soil':
                     info += f", Threshold: {dev.threshold}%"
-                elif isinstance(dev, IrrigationController):
+                elif kind == 'irrig':
                     info += f", Flow Rate: {dev.water_flow_rate} L/min"
-                elif isinstance(dev, CropHealthAnalyzer):
+                elif kind == 'crop':
                     info += f", Health Index: {dev.health_index:.1f}"
-                print(f"    - {info}")
+                lines.append(f"    - {info}")
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
 
     def show_help(self):
-        print("\n🌟 Available Device Types:")
-        print(" - SoilMoistureSensor (or just 'soil')")
-        print(" - WeatherMonitor (or just 'weather')")
-        print(" - IrrigationController (or just 'irrigation')")
-        print(" - CropHealthAnalyzer (or just 'crop' or 'health')")
+        sys.stdout.write(HELP)
+        sys.stdout.flush()
+
+
+# Menu text is built once and written in a single call per render
+HELP = (
+    "\n🌟 Available Device Types:\n"
+    " - SoilMoistureSensor (or just 'soil')\n"
+    " - WeatherMonitor (or just 'weather')\n"
+    " - IrrigationController (or just 'irrigation')\n"
+    " - CropHealthAnalyzer (or just 'crop' or 'health')\n"
+)
+
+MENU = (
+    "\n" + "=" * 50 + "\n"
+    "🌟 Welcome to Smart Farming System 🌟\n"
+    "1. Create a new station\n"
+    "2. Create a new device\n"
+    "3. Display system state\n"
+    "4. Modify device settings\n"
+    "5. Show help (device types)\n"
+    "6. Toggle device status ON/OFF\n"
+    "7. Exit\n"
+)
 
 
 # Entry Point
@@ -267,15 +401,8 @@ if __name__ == "__main__":
     farmville = Main()
 
     while True:
-        print("\n" + "=" * 50)
-        print("🌟 Welcome to Smart Farming System 🌟")
-        print("1. Create a new station")
-        print("2. Create a new device")
-        print("3. Display system state")
-        print("4. Modify device settings")
-        print("5. Show help (device types)")
-        print("6. Toggle device status ON/OFF")
-        print("7. Exit")
+        sys.stdout.write(MENU)
+        sys.stdout.flush()
 
         choice = input("Pick an option (1–7): ")
 